@@ -1,4 +1,5 @@
 import argparse
+import logging
 from src.cli import ZerePyCLI
 
 if __name__ == "__main__":
@@ -8,6 +9,9 @@ if __name__ == "__main__":
     parser.add_argument('--port', type=int, default=8000, help='Server port (default: 8000)')
     args = parser.parse_args()
 
+    # Configure logging
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     if args.server:
         try:
             from src.server import start_server
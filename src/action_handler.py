@@ -1,20 +1,24 @@
 import logging
+import sys
 
 logger = logging.getLogger("action_handler")
 
 action_registry = {}    
 
-def register_action(action_name):
+def register_action(action_name, replace=False):
     def decorator(func):
-        action_registry[action_name] = func
+        # Static handlers must not collide; connections that re-register their actions at runtime pass replace=True
+        if action_name in action_registry and not replace:
+            raise ValueError(f"Action {action_name} is already registered")
+        action_registry[sys.intern(action_name)] = func
         return func
     return decorator
 
 def execute_action(agent, action_name, **kwargs):
-    if action_name in action_registry:
-       return action_registry[action_name](agent, **kwargs)
-    else:
+    action = action_registry.get(action_name)
+    if action is None:
         logger.error(f"Action {action_name} not found")
         return None
+    return action(agent, **kwargs)
     
 
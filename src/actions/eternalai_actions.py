@@ -3,55 +3,51 @@ from src.action_handler import register_action
 
 logger = logging.getLogger("agent")
 
-@register_action("eternai-generate")
-def eternai_generate(agent, **kwargs):
-    """Generate text using EternalAI models"""
-    agent.logger.info("\n🤖 GENERATING TEXT WITH ETERNAI")
-    try:
-        result = agent.connection_manager.perform_action(
-            connection_name="eternalai",
-            action_name="generate-text",
-            params=[
-                kwargs.get('prompt'),
-                kwargs.get('system_prompt', agent._construct_system_prompt()),
-                kwargs.get('model', None)
-            ]
-        )
-        agent.logger.info("✅ Text generation completed!")
-        return result
-    except Exception as e:
-        agent.logger.error(f"❌ Text generation failed: {str(e)}")
-        return None
+def _eternalai_action(action_name, start_message, error_message, build_params, describe_result, error_result=None):
+    """Build a handler that forwards to an EternalAI connection action"""
+    def handler(agent, **kwargs):
+        agent.logger.info(start_message)
+        try:
+            result = agent.connection_manager.perform_action(
+                connection_name="eternalai",
+                action_name=action_name,
+                params=build_params(agent, kwargs)
+            )
+            agent.logger.info(describe_result(result))
+            return result
+        except Exception as e:
+            agent.logger.error(f"❌ {error_message}: {str(e)}")
+            return error_result
+    return handler
 
-@register_action("eternai-check-model")
-def eternai_check_model(agent, **kwargs):
-    """Check if a specific model is available"""
-    agent.logger.info("\n🔍 CHECKING MODEL AVAILABILITY")
-    try:
-        result = agent.connection_manager.perform_action(
-            connection_name="eternalai",
-            action_name="check-model",
-            params=[kwargs.get('model')]
-        )
-        status = "available" if result else "not available"
-        agent.logger.info(f"Model is {status}")
-        return result
-    except Exception as e:
-        agent.logger.error(f"❌ Model check failed: {str(e)}")
-        return False
+# Generate text using EternalAI models
+eternai_generate = register_action("eternai-generate")(_eternalai_action(
+    "generate-text",
+    "\n🤖 GENERATING TEXT WITH ETERNAI",
+    "Text generation failed",
+    lambda agent, kwargs: [
+        kwargs.get('prompt'),
+        kwargs.get('system_prompt') or agent._construct_system_prompt(),
+        kwargs.get('model', None)
+    ],
+    lambda result: "✅ Text generation completed!"
+))
 
-@register_action("eternai-list-models")
-def eternai_list_models(agent, **kwargs):
-    """List all available EternalAI models"""
-    agent.logger.info("\n📋 LISTING AVAILABLE MODELS")
-    try:
-        result = agent.connection_manager.perform_action(
-            connection_name="eternalai",
-            action_name="list-models",
-            params=[]
-        )
-        agent.logger.info("✅ Models listed successfully!")
-        return result
-    except Exception as e:
-        agent.logger.error(f"❌ Model listing failed: {str(e)}")
-        return None
\ No newline at end of file
+# Check if a specific model is available
+eternai_check_model = register_action("eternai-check-model")(_eternalai_action(
+    "check-model",
+    "\n🔍 CHECKING MODEL AVAILABILITY",
+    "Model check failed",
+    lambda agent, kwargs: [kwargs.get('model')],
+    lambda result: f"Model is {'available' if result else 'not available'}",
+    error_result=False
+))
+
+# List all available EternalAI models
+eternai_list_models = register_action("eternai-list-models")(_eternalai_action(
+    "list-models",
+    "\n📋 LISTING AVAILABLE MODELS",
+    "Model listing failed",
+    lambda agent, kwargs: [],
+    lambda result: "✅ Models listed successfully!"
+))
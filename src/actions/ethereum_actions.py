@@ -2,10 +2,11 @@ import logging
 import os
 from dotenv import load_dotenv
 from src.action_handler import register_action
+from src.helpers.evm import account_from_key
 
 logger = logging.getLogger("actions.ethereum_actions")
 
-@register_action("get-token-by-ticker")
+@register_action("get-eth-token-by-ticker")
 def get_token_by_ticker(agent, **kwargs):
     """Get token address by ticker symbol"""
     try:
@@ -32,14 +33,16 @@ def get_eth_balance(agent, **kwargs):
     """Get native or token balance"""
     try:
         token_address = kwargs.get("token_address")
+        ethereum = agent.connection_manager.connections["ethereum"]
         
-        load_dotenv()
         private_key = os.getenv('ETH_PRIVATE_KEY')
-        web3 = agent.connection_manager.connections["ethereum"]._web3
-        account = web3.eth.account.from_key(private_key)
+        if not private_key:
+            load_dotenv()
+            private_key = os.getenv('ETH_PRIVATE_KEY')
+        account = account_from_key(private_key)
         address = account.address
 
-        balance = agent.connection_manager.connections["ethereum"].get_balance(
+        balance = ethereum.get_balance(
             address=address,
             token_address=token_address
         )
@@ -2,6 +2,7 @@ import logging
 import os
 from dotenv import load_dotenv
 from src.action_handler import register_action
+from src.helpers.evm import account_from_key
 
 logger = logging.getLogger("actions.sonic_actions")
 
@@ -36,16 +37,18 @@ def get_sonic_balance(agent, **kwargs):
     try:
         address = kwargs.get("address")
         token_address = kwargs.get("token_address")
+        sonic = agent.connection_manager.connections["sonic"]
         
         if not address:
-            load_dotenv()
             private_key = os.getenv('SONIC_PRIVATE_KEY')
-            web3 = agent.connection_manager.connections["sonic"]._web3
-            account = web3.eth.account.from_key(private_key)
+            if not private_key:
+                load_dotenv()
+                private_key = os.getenv('SONIC_PRIVATE_KEY')
+            account = account_from_key(private_key)
             address = account.address
 
         # Direct passthrough to connection method - add your logic before/after this call!
-        agent.connection_manager.connections["sonic"].get_balance(
+        sonic.get_balance(
             address=address,
             token_address=token_address
         )
@@ -8,10 +8,7 @@ from src.prompts import POST_TWEET_PROMPT, REPLY_TWEET_PROMPT
 def post_tweet(agent, **kwargs):
     current_time = time.time()
 
-    if ("last_tweet_time" not in agent.state):
-        last_tweet_time = 0
-    else:
-        last_tweet_time = agent.state["last_tweet_time"]
+    last_tweet_time = agent.state.get("last_tweet_time", 0)
 
     if current_time - last_tweet_time >= agent.tweet_interval:
         agent.logger.info("\n📝 GENERATING NEW TWEET")
@@ -38,8 +35,9 @@ def post_tweet(agent, **kwargs):
 
 @register_action("reply-to-tweet")
 def reply_to_tweet(agent, **kwargs):
-    if "timeline_tweets" in agent.state and agent.state["timeline_tweets"] is not None and len(agent.state["timeline_tweets"]) > 0:
-        tweet = agent.state["timeline_tweets"].pop(0)
+    timeline_tweets = agent.state.get("timeline_tweets")
+    if timeline_tweets:
+        tweet = timeline_tweets.popleft()
         tweet_id = tweet.get('id')
         if not tweet_id:
             return
@@ -65,8 +63,9 @@ def reply_to_tweet(agent, **kwargs):
 
 @register_action("like-tweet")
 def like_tweet(agent, **kwargs):
-    if "timeline_tweets" in agent.state and agent.state["timeline_tweets"] is not None and len(agent.state["timeline_tweets"]) > 0:
-        tweet = agent.state["timeline_tweets"].pop(0)
+    timeline_tweets = agent.state.get("timeline_tweets")
+    if timeline_tweets:
+        tweet = timeline_tweets.popleft()
         tweet_id = tweet.get('id')
         if not tweet_id:
             return False
@@ -79,7 +78,7 @@ def like_tweet(agent, **kwargs):
                 params=[tweet.get('author_id')]
             )
             if replies:
-                agent.state["timeline_tweets"].extend(replies[:agent.own_tweet_replies_count])
+                timeline_tweets.extend(replies[:agent.own_tweet_replies_count])
             return True 
 
         agent.logger.info(f"\n👍 LIKING TWEET: {tweet.get('text', '')[:50]}...")
@@ -1,8 +1,13 @@
+import hashlib
+import itertools
 import json
 import random
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
+import sys
 from pathlib import Path
 from dotenv import load_dotenv
 from src.connection_manager import ConnectionManager
@@ -11,12 +16,69 @@ from src.action_handler import execute_action
 import src.actions.twitter_actions  
 import src.actions.echochamber_actions
 import src.actions.solana_actions
-from datetime import datetime
+
+try:
+    # orjson parses agent files noticeably faster when it is installed
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 REQUIRED_FIELDS = ["name", "bio", "traits", "examples", "loop_delay", "config", "tasks"]
 
 logger = logging.getLogger("agent")
 
+# Parsed agent files keyed by path, stored with the mtime they were parsed at, so reloading
+# an unchanged agent skips the JSON parse and an edited file replaces its old entry
+_AGENT_JSON_CACHE = {}
+
+def _load_agent_dict(agent_path: Path) -> dict:
+    """Load an agent JSON file, reusing the parsed result while the file is unchanged"""
+    key = str(agent_path)
+    mtime_ns = os.stat(agent_path).st_mtime_ns
+    cached = _AGENT_JSON_CACHE.get(key)
+    if cached is None or cached[0] != mtime_ns:
+        agent_dict = _json_loads(agent_path.read_bytes())
+        for task in agent_dict.get("tasks", []):
+            # Interned names let action registry lookups match on identity
+            task["name"] = sys.intern(task["name"])
+        cached = (mtime_ns, agent_dict)
+        _AGENT_JSON_CACHE[key] = cached
+    # Nested values are shared between agents and treated as read-only
+    return dict(cached[1])
+
+ZEREPY_DIR = Path.home() / ".zerepy"
+
+# System prompts that embed example account tweets are kept on disk so restarts skip the Twitter fetches
+SYSTEM_PROMPT_CACHE_DIR = ZEREPY_DIR / "prompt_cache"
+SYSTEM_PROMPT_CACHE_TTL = 6 * 60 * 60
+
+# Timestamps that gate actions are persisted so a restart honors the remaining cooldowns
+AGENT_STATE_DIR = ZEREPY_DIR / "state"
+PERSISTED_STATE_KEYS = ("last_tweet_time", "echochambers_last_message")
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    """Write text to a temporary file and move it into place"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+def _read_cached_system_prompt(cache_path: Path):
+    """Return the cached system prompt if it exists and is still fresh"""
+    try:
+        if time.time() - cache_path.stat().st_mtime < SYSTEM_PROMPT_CACHE_TTL:
+            return cache_path.read_text(encoding="utf-8")
+    except OSError:
+        pass
+    return None
+
+def _write_cached_system_prompt(cache_path: Path, system_prompt: str) -> None:
+    """Atomically write the system prompt to the disk cache"""
+    try:
+        _atomic_write_text(cache_path, system_prompt)
+    except OSError as e:
+        logger.warning(f"Could not cache system prompt: {e}")
+
 class ZerePyAgent:
     def __init__(
             self,
@@ -24,7 +86,7 @@ class ZerePyAgent:
     ):
         try:
             agent_path = Path("agents") / f"{agent_name}.json"
-            agent_dict = json.load(open(agent_path, "r"))
+            agent_dict = _load_agent_dict(agent_path)
 
             missing_fields = [field for field in REQUIRED_FIELDS if field not in agent_dict]
             if missing_fields:
@@ -40,11 +102,13 @@ class ZerePyAgent:
             self.use_time_based_weights = agent_dict["use_time_based_weights"]
             self.time_based_multipliers = agent_dict["time_based_multipliers"]
 
-            has_twitter_tasks = any("tweet" in task["name"] for task in agent_dict.get("tasks", []))
+            # Task types decide which inputs the loop replenishes, so check them once here
+            self._has_twitter_tasks = any("tweet" in task["name"] for task in agent_dict.get("tasks", []))
+            self._has_echochambers_tasks = any("echochambers" in task["name"] for task in agent_dict.get("tasks", []))
             
             twitter_config = next((config for config in agent_dict["config"] if config["name"] == "twitter"), None)
             
-            if has_twitter_tasks and twitter_config:
+            if self._has_twitter_tasks and twitter_config:
                 self.tweet_interval = twitter_config.get("tweet_interval", 900)
                 self.own_tweet_replies_count = twitter_config.get("own_tweet_replies_count", 2)
 
@@ -62,16 +126,25 @@ class ZerePyAgent:
             # Extract loop tasks
             self.tasks = agent_dict.get("tasks", [])
             self.task_weights = [task.get("weight", 0) for task in self.tasks]
+            # Cumulative weights let random.choices skip re-accumulating on every selection
+            self._task_cum_weights = list(itertools.accumulate(self.task_weights))
+            # Time-adjusted cumulative weights depend only on the hour, so they are filled in lazily per hour
+            self._hourly_cum_weights = [None] * 24
             self.logger = logging.getLogger("agent")
 
             # Set up empty agent state
             self.state = {}
+            self._state_path = AGENT_STATE_DIR / f"state_{agent_name}.json"
+            self._persisted_state = {}
 
         except Exception as e:
             logger.error("Could not load ZerePy agent")
             raise e
 
     def _setup_llm_provider(self):
+        if self.is_llm_set:
+            return
+
         # Get first available LLM provider and its model
         llm_providers = self.connection_manager.get_model_providers()
         if not llm_providers:
@@ -79,43 +152,98 @@ class ZerePyAgent:
         self.model_provider = llm_providers[0]
 
         # Load Twitter username for self-reply detection if Twitter tasks exist
-        if any("tweet" in task["name"] for task in self.tasks):
-            load_dotenv()
+        if self._has_twitter_tasks:
+            if 'TWITTER_USERNAME' not in os.environ:
+                load_dotenv()
             self.username = os.getenv('TWITTER_USERNAME', '').lower()
             if not self.username:
                 logger.warning("Twitter username not found, some Twitter functionalities may be limited")
 
+        self.is_llm_set = True
+
+    def _load_persisted_state(self) -> None:
+        """Restore action timestamps saved by a previous run"""
+        try:
+            saved_state = _json_loads(self._state_path.read_bytes())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load saved agent state: {e}")
+            return
+
+        for key in PERSISTED_STATE_KEYS:
+            if key in saved_state:
+                self.state[key] = saved_state[key]
+        self._persisted_state = saved_state
+
+    def _persist_state(self) -> None:
+        """Save action timestamps if they changed since the last save"""
+        snapshot = {key: self.state[key] for key in PERSISTED_STATE_KEYS if key in self.state}
+        if snapshot == self._persisted_state:
+            return
+        try:
+            _atomic_write_text(self._state_path, json.dumps(snapshot))
+            self._persisted_state = snapshot
+        except OSError as e:
+            logger.warning(f"Could not save agent state: {e}")
+
+    def _system_prompt_cache_path(self) -> Path:
+        key_source = json.dumps([self.bio, self.traits, self.examples, self.example_accounts], sort_keys=True)
+        key = hashlib.blake2b(key_source.encode("utf-8"), digest_size=16).hexdigest()
+        return SYSTEM_PROMPT_CACHE_DIR / f"system_prompt_{key}.txt"
+
     def _construct_system_prompt(self) -> str:
         """Construct the system prompt from agent configuration"""
         if self._system_prompt is None:
-            prompt_parts = []
-            prompt_parts.extend(self.bio)
+            cache_path = self._system_prompt_cache_path() if self.example_accounts else None
+            if cache_path:
+                self._system_prompt = _read_cached_system_prompt(cache_path)
 
-            if self.traits:
-                prompt_parts.append("\nYour key traits are:")
-                prompt_parts.extend(f"- {trait}" for trait in self.traits)
+            if self._system_prompt is None:
+                self._system_prompt, complete = self._build_system_prompt()
+                # Only persist prompts where every example account returned tweets
+                if cache_path and complete:
+                    _write_cached_system_prompt(cache_path, self._system_prompt)
 
-            if self.examples or self.example_accounts:
-                prompt_parts.append("\nHere are some examples of your style (Please avoid repeating any of these):")
-                if self.examples:
-                    prompt_parts.extend(f"- {example}" for example in self.examples)
+        return self._system_prompt
 
-                if self.example_accounts:
-                    for example_account in self.example_accounts:
-                        tweets = self.connection_manager.perform_action(
+    def _build_system_prompt(self):
+        """Build the system prompt, returning it with whether all example tweets were fetched"""
+        complete = True
+        prompt_parts = []
+        prompt_parts.extend(self.bio)
+
+        if self.traits:
+            prompt_parts.append("\nYour key traits are:")
+            prompt_parts.extend(f"- {trait}" for trait in self.traits)
+
+        if self.examples or self.example_accounts:
+            prompt_parts.append("\nHere are some examples of your style (Please avoid repeating any of these):")
+            if self.examples:
+                prompt_parts.extend(f"- {example}" for example in self.examples)
+
+            if self.example_accounts:
+                # Fetch all example accounts concurrently; map keeps the configured order
+                with ThreadPoolExecutor(max_workers=min(8, len(self.example_accounts))) as executor:
+                    account_tweets = list(executor.map(
+                        lambda example_account: self.connection_manager.perform_action(
                             connection_name="twitter",
                             action_name="get-latest-tweets",
                             params=[example_account]
-                        )
-                        if tweets:
-                            prompt_parts.extend(f"- {tweet['text']}" for tweet in tweets)
-
-            self._system_prompt = "\n".join(prompt_parts)
-
-        return self._system_prompt
+                        ),
+                        self.example_accounts
+                    ))
+                for tweets in account_tweets:
+                    if tweets:
+                        prompt_parts.extend(f"- {tweet['text']}" for tweet in tweets)
+                    else:
+                        complete = False
+
+        return "\n".join(prompt_parts), complete
     
     def _adjust_weights_for_time(self, current_hour: int, task_weights: list) -> list:
-        weights = task_weights.copy()
+        # Each adjustment builds a new list, so the input is never mutated
+        weights = task_weights
         
         # Reduce tweet frequency during night hours (1 AM - 5 AM)
         if 1 <= current_hour <= 5:
@@ -137,7 +265,10 @@ class ZerePyAgent:
 
     def prompt_llm(self, prompt: str, system_prompt: str = None) -> str:
         """Generate text using the configured LLM provider"""
-        system_prompt = system_prompt or self._construct_system_prompt()
+        if not self.is_llm_set:
+            self._setup_llm_provider()
+
+        system_prompt = system_prompt or self._system_prompt or self._construct_system_prompt()
 
         return self.connection_manager.perform_action(
             connection_name=self.model_provider,
@@ -149,28 +280,34 @@ class ZerePyAgent:
         return self.connection_manager.perform_action(connection, action, **kwargs)
     
     def select_action(self, use_time_based_weights: bool = False) -> dict:
-        task_weights = [weight for weight in self.task_weights.copy()]
+        if not use_time_based_weights:
+            return random.choices(self.tasks, cum_weights=self._task_cum_weights, k=1)[0]
+
+        current_hour = time.localtime().tm_hour
+        cum_weights = self._hourly_cum_weights[current_hour]
+        if cum_weights is None:
+            task_weights = self._adjust_weights_for_time(current_hour, self.task_weights)
+            cum_weights = list(itertools.accumulate(task_weights))
+            self._hourly_cum_weights[current_hour] = cum_weights
         
-        if use_time_based_weights:
-            current_hour = datetime.now().hour
-            task_weights = self._adjust_weights_for_time(current_hour, task_weights)
-        
-        return random.choices(self.tasks, weights=task_weights, k=1)[0]
+        return random.choices(self.tasks, cum_weights=cum_weights, k=1)[0]
 
-    def loop(self):
-        """Main agent loop for autonomous behavior"""
+    def loop(self, startup_delay: int = 0):
+        """Main agent loop for autonomous behavior, optionally counting down startup_delay seconds first"""
         if not self.is_llm_set:
             self._setup_llm_provider()
 
+        self._load_persisted_state()
+
         logger.info("\n🚀 Starting agent loop...")
         logger.info("Press Ctrl+C at any time to stop the loop.")
         print_h_bar()
 
-        time.sleep(2)
-        logger.info("Starting loop in 5 seconds...")
-        for i in range(5, 0, -1):
-            logger.info(f"{i}...")
-            time.sleep(1)
+        if startup_delay > 0:
+            logger.info(f"Starting loop in {startup_delay} seconds...")
+            for i in range(startup_delay, 0, -1):
+                logger.info(f"{i}...")
+                time.sleep(1)
 
         try:
             while True:
@@ -178,17 +315,19 @@ class ZerePyAgent:
                 try:
                     # REPLENISH INPUTS
                     # TODO: Add more inputs to complexify agent behavior
-                    if "timeline_tweets" not in self.state or self.state["timeline_tweets"] is None or len(self.state["timeline_tweets"]) == 0:
-                        if any("tweet" in task["name"] for task in self.tasks):
+                    if not self.state.get("timeline_tweets"):
+                        if self._has_twitter_tasks:
                             logger.info("\n👀 READING TIMELINE")
-                            self.state["timeline_tweets"] = self.connection_manager.perform_action(
+                            timeline = self.connection_manager.perform_action(
                                 connection_name="twitter",
                                 action_name="read-timeline",
                                 params=[]
                             )
+                            # Actions consume tweets from the front, which is O(1) on a deque
+                            self.state["timeline_tweets"] = deque(timeline or [])
 
-                    if "room_info" not in self.state or self.state["room_info"] is None:
-                        if any("echochambers" in task["name"] for task in self.tasks):
+                    if self.state.get("room_info") is None:
+                        if self._has_echochambers_tasks:
                             logger.info("\n👀 READING ECHOCHAMBERS ROOM INFO")
                             self.state["room_info"] = self.connection_manager.perform_action(
                                 connection_name="echochambers",
@@ -204,6 +343,7 @@ class ZerePyAgent:
 
                     # PERFORM ACTION
                     success = execute_action(self, action_name)
+                    self._persist_state()
 
                     logger.info(f"\n⏳ Waiting {self.loop_delay} seconds before next loop...")
                     print_h_bar()
@@ -14,8 +14,6 @@ from prompt_toolkit.history import FileHistory
 from src.agent import ZerePyAgent
 from src.helpers import print_h_bar
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger("cli")
 
 @dataclass
@@ -414,7 +412,7 @@ class ZerePyCLI:
             return
 
         try:
-            self.agent.loop()
+            self.agent.loop(startup_delay=5)
         except KeyboardInterrupt:
             logger.info("\n🛑 Agent loop stopped by user.")
         except Exception as e:
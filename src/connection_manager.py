@@ -1,30 +1,36 @@
+import importlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, List, Optional, Type, Dict
 from src.connections.base_connection import BaseConnection
-from src.connections.anthropic_connection import AnthropicConnection
-from src.connections.eternalai_connection import EternalAIConnection
-from src.connections.goat_connection import GoatConnection
-from src.connections.groq_connection import GroqConnection
-from src.connections.openai_connection import OpenAIConnection
-from src.connections.twitter_connection import TwitterConnection
-from src.connections.farcaster_connection import FarcasterConnection
-from src.connections.ollama_connection import OllamaConnection
-from src.connections.echochambers_connection import EchochambersConnection
-from src.connections.solana_connection import SolanaConnection
-from src.connections.hyperbolic_connection import HyperbolicConnection
-from src.connections.galadriel_connection import GaladrielConnection
-from src.connections.sonic_connection import SonicConnection
-from src.connections.discord_connection import DiscordConnection
-from src.connections.allora_connection import AlloraConnection
-from src.connections.xai_connection import XAIConnection
-from src.connections.ethereum_connection import EthereumConnection
-from src.connections.together_connection import TogetherAIConnection
-from src.connections.evm_connection import EVMConnection
-from src.connections.perplexity_connection import PerplexityConnection
-from src.connections.monad_connection import MonadConnection
 
 logger = logging.getLogger("connection_manager")
 
+# Connection modules pull in heavy SDKs (web3, solana, goat, ...), so each one
+# is imported only when an agent config actually uses it
+CONNECTION_CLASSES = {
+    "twitter": ("src.connections.twitter_connection", "TwitterConnection"),
+    "anthropic": ("src.connections.anthropic_connection", "AnthropicConnection"),
+    "openai": ("src.connections.openai_connection", "OpenAIConnection"),
+    "farcaster": ("src.connections.farcaster_connection", "FarcasterConnection"),
+    "groq": ("src.connections.groq_connection", "GroqConnection"),
+    "eternalai": ("src.connections.eternalai_connection", "EternalAIConnection"),
+    "ollama": ("src.connections.ollama_connection", "OllamaConnection"),
+    "echochambers": ("src.connections.echochambers_connection", "EchochambersConnection"),
+    "goat": ("src.connections.goat_connection", "GoatConnection"),
+    "solana": ("src.connections.solana_connection", "SolanaConnection"),
+    "hyperbolic": ("src.connections.hyperbolic_connection", "HyperbolicConnection"),
+    "galadriel": ("src.connections.galadriel_connection", "GaladrielConnection"),
+    "sonic": ("src.connections.sonic_connection", "SonicConnection"),
+    "discord": ("src.connections.discord_connection", "DiscordConnection"),
+    "allora": ("src.connections.allora_connection", "AlloraConnection"),
+    "xai": ("src.connections.xai_connection", "XAIConnection"),
+    "ethereum": ("src.connections.ethereum_connection", "EthereumConnection"),
+    "together": ("src.connections.together_connection", "TogetherAIConnection"),
+    "evm": ("src.connections.evm_connection", "EVMConnection"),
+    "perplexity": ("src.connections.perplexity_connection", "PerplexityConnection"),
+    "monad": ("src.connections.monad_connection", "MonadConnection"),
+}
 
 class ConnectionManager:
     def __init__(self, agent_config):
@@ -34,49 +40,11 @@ class ConnectionManager:
 
     @staticmethod
     def _class_name_to_type(class_name: str) -> Type[BaseConnection]:
-        if class_name == "twitter":
-            return TwitterConnection
-        elif class_name == "anthropic":
-            return AnthropicConnection
-        elif class_name == "openai":
-            return OpenAIConnection
-        elif class_name == "farcaster":
-            return FarcasterConnection
-        elif class_name == "groq":
-            return GroqConnection
-        elif class_name == "eternalai":
-            return EternalAIConnection
-        elif class_name == "ollama":
-            return OllamaConnection
-        elif class_name == "echochambers":
-            return EchochambersConnection
-        elif class_name == "goat":
-            return GoatConnection
-        elif class_name == "solana":
-            return SolanaConnection
-        elif class_name == "hyperbolic":
-            return HyperbolicConnection
-        elif class_name == "galadriel":
-            return GaladrielConnection
-        elif class_name == "sonic":
-            return SonicConnection
-        elif class_name == "discord":
-            return DiscordConnection
-        elif class_name == "allora":
-            return AlloraConnection
-        elif class_name == "xai":
-            return XAIConnection
-        elif class_name == "ethereum":
-            return EthereumConnection
-        elif class_name == "together":
-            return TogetherAIConnection
-        elif class_name == "evm":
-            return EVMConnection
-        elif class_name == "perplexity":
-            return PerplexityConnection
-        elif class_name == "monad":
-            return MonadConnection
-        return None
+        location = CONNECTION_CLASSES.get(class_name)
+        if location is None:
+            return None
+        module_name, connection_class_name = location
+        return getattr(importlib.import_module(module_name), connection_class_name)
 
     def _register_connection(self, config_dic: Dict[str, Any]) -> None:
         """
@@ -108,11 +76,13 @@ class ConnectionManager:
             logging.error(f"\nAn error occurred: {e}")
             return False
 
-    def configure_connection(self, connection_name: str) -> bool:
+    def configure_connection(self, connection_name: str, **params) -> bool:
         """Configure a specific connection"""
         try:
             connection = self.connections[connection_name]
-            success = connection.configure()
+            # Credentials may change, so the next action probes again
+            connection.invalidate_configured()
+            success = connection.configure(**params)
 
             if success:
                 logging.info(
@@ -176,7 +146,7 @@ class ConnectionManager:
         try:
             connection = self.connections[connection_name]
 
-            if not connection.is_configured():
+            if not connection.is_configured_cached():
                 logging.error(
                     f"\nError: Connection '{connection_name}' is not configured"
                 )
@@ -191,20 +161,15 @@ class ConnectionManager:
             action = connection.actions[action_name]
 
             # Convert list of params to kwargs dictionary, handling both required and optional params
-            kwargs = {}
-            param_index = 0
-
-            # Add provided parameters up to the number provided
-            for i, param in enumerate(action.parameters):
-                if param_index < len(params):
-                    kwargs[param.name] = params[param_index]
-                    param_index += 1
+            kwargs = {
+                param.name: value for param, value in zip(action.parameters, params)
+            }
 
-            # Validate all required parameters are present
+            # Parameters past the provided values are the only ones that can be missing
             missing_required = [
                 param.name
-                for param in action.parameters
-                if param.required and param.name not in kwargs
+                for param in action.parameters[len(params):]
+                if param.required
             ]
 
             if missing_required:
@@ -216,6 +181,9 @@ class ConnectionManager:
             return connection.perform_action(action_name, kwargs)
 
         except Exception as e:
+            # A failing action may mean the credentials went bad; probe again next time
+            if connection_name in self.connections:
+                self.connections[connection_name].invalidate_configured()
             logging.error(
                 f"\nAn error occurred while trying action {action_name} for {connection_name} connection: {e}"
             )
@@ -223,8 +191,17 @@ class ConnectionManager:
 
     def get_model_providers(self) -> List[str]:
         """Get a list of all LLM provider connections"""
-        return [
-            name
+        # Only LLM connections need the is_configured probe, which usually hits the network
+        candidates = [
+            (name, conn)
             for name, conn in self.connections.items()
-            if conn.is_configured() and getattr(conn, "is_llm_provider", lambda: False)
+            if getattr(conn, "is_llm_provider", False)
         ]
+        if not candidates:
+            return []
+
+        # Probe the candidates concurrently; map keeps them in configured order
+        with ThreadPoolExecutor(max_workers=len(candidates)) as executor:
+            configured = list(executor.map(lambda candidate: candidate[1].is_configured(), candidates))
+
+        return [name for (name, _), is_configured in zip(candidates, configured) if is_configured]
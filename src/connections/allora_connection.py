@@ -3,11 +3,15 @@ from typing import List, Dict, Any
 from dotenv import set_key
 from allora_sdk.v2.api_client import AlloraAPIClient, ChainSlug
 from src.connections.base_connection import BaseConnection, Action, ActionParameter
+from src.helpers.event_loop import BackgroundEventLoop
 import os
-import asyncio
+import time
 
 logger = logging.getLogger("connections.allora_connection")
 
+# The topic list changes rarely; reuse it for a few minutes
+TOPICS_CACHE_TTL = 300
+
 class AlloraConnectionError(Exception):
     """Base exception for Allora connection errors"""
     pass
@@ -24,6 +28,8 @@ class AlloraConnection(BaseConnection):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self._client = None
+        self._topics_cache = None
+        self._loop = BackgroundEventLoop("allora-loop")
         self.chain_slug = config.get("chain_slug", ChainSlug.TESTNET)
 
     @property
@@ -66,14 +72,8 @@ class AlloraConnection(BaseConnection):
             client = self._get_client()
             method = getattr(client, method_name)
             
-            # Create event loop for async calls
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                response = loop.run_until_complete(method(*args, **kwargs))
-                return response
-            finally:
-                loop.close()
+            # Run on one long-lived loop instead of building and tearing one down per call
+            return self._loop.run(method(*args, **kwargs))
                 
         except Exception as e:
             raise AlloraAPIError(f"API request failed: {str(e)}")
@@ -91,8 +91,12 @@ class AlloraConnection(BaseConnection):
 
     def list_topics(self) -> List[Dict[str, Any]]:
         """List all available Allora Network topics"""
+        if self._topics_cache and time.monotonic() - self._topics_cache[0] < TOPICS_CACHE_TTL:
+            return self._topics_cache[1]
         try:
-            return self._make_request('get_all_topics')
+            topics = self._make_request('get_all_topics')
+            self._topics_cache = (time.monotonic(), topics)
+            return topics
         except Exception as e:
             raise AlloraAPIError(f"Failed to list topics: {str(e)}")
 
@@ -145,6 +149,5 @@ class AlloraConnection(BaseConnection):
         if errors:
             raise ValueError(f"Invalid parameters: {', '.join(errors)}")
 
-        method_name = action_name.replace('-', '_')
-        method = getattr(self, method_name)
+        method = self._action_methods[action_name]
         return method(**kwargs)
\ No newline at end of file
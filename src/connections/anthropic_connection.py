@@ -200,6 +200,5 @@ class AnthropicConnection(BaseConnection):
             raise ValueError(f"Invalid parameters: {', '.join(errors)}")
 
         # Call the appropriate method based on action name
-        method_name = action_name.replace('-', '_')
-        method = getattr(self, method_name)
+        method = self._action_methods[action_name]
         return method(**kwargs)
\ No newline at end of file
@@ -1,16 +1,17 @@
 import logging
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Callable
+from typing import Any, Dict, List, Callable, Optional, get_origin
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ActionParameter:
     name: str
     required: bool
     type: type
     description: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Action:
     name: str
     parameters: List[ActionParameter]
@@ -19,16 +20,27 @@ class Action:
     def validate_params(self, params: Dict[str, Any]) -> List[str]:
         errors = []
         for param in self.parameters:
-            if param.required and param.name not in params:
-                errors.append(f"Missing required parameter: {param.name}")
-            elif param.name in params:
+            if param.name not in params:
+                if param.required:
+                    errors.append(f"Missing required parameter: {param.name}")
+                continue
+            value = params[param.name]
+            # Values coming from Python callers are usually already typed; only coerce the rest.
+            # Generic hints such as List[str] are checked against their origin type.
+            if not isinstance(value, get_origin(param.type) or param.type):
                 try:
-                    params[param.name] = param.type(params[param.name])
+                    params[param.name] = param.type(value)
                 except ValueError:
                     errors.append(f"Invalid type for {param.name}. Expected {param.type.__name__}")
         return errors
 
+# is_configured usually makes a network call, so a positive result is trusted this long
+CONFIGURED_CHECK_TTL = 300
+
 class BaseConnection(ABC):
+    # When is_configured last succeeded; None until the first positive probe
+    _configured_at: Optional[float] = None
+
     def __init__(self, config):
         try:
             # Dictionary to store action name -> handler method mapping
@@ -37,6 +49,12 @@ class BaseConnection(ABC):
             self.config = self.validate_config(config) 
             # Register actions during initialization
             self.register_actions()
+            # Resolve each action to its bound method once, so dispatch is a dict lookup
+            self._action_methods: Dict[str, Callable] = {
+                name: method
+                for name in self.actions
+                if (method := getattr(self, name.replace('-', '_'), None)) is not None
+            }
         except Exception as e:
             logging.error("Could not initialize the connection")
             raise e
@@ -84,6 +102,20 @@ class BaseConnection(ABC):
         """
         pass
 
+    def is_configured_cached(self, verbose = False) -> bool:
+        """Check is_configured, reusing a recent positive result instead of probing again"""
+        if self._configured_at is not None and time.monotonic() - self._configured_at < CONFIGURED_CHECK_TTL:
+            return True
+
+        if not self.is_configured(verbose=verbose):
+            return False
+        self._configured_at = time.monotonic()
+        return True
+
+    def invalidate_configured(self) -> None:
+        """Forget the cached is_configured result so the next check probes again"""
+        self._configured_at = None
+
     @abstractmethod
     def register_actions(self) -> None:
         """
@@ -7,8 +7,23 @@ from src.helpers import print_h_bar
 import requests
 import json
 
+try:
+    # orjson parses response bytes directly and serializes payloads faster when installed
+    from orjson import loads as _json_loads, dumps as _json_dumps
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 logger = logging.getLogger("connections.discord_connection")
 
+# Action name -> (parameter, config key) filled from the agent config when omitted
+ACTION_CONFIG_DEFAULTS = {
+    "read-messages": ("count", "message_read_count"),
+    "read-mentioned-messages": ("count", "message_read_count"),
+    "react-to-message": ("emoji_name", "message_emoji_name"),
+    "list-channels": ("server_id", "server_id"),
+}
+
 
 class DiscordConnectionError(Exception):
     """Base exception for Discord connection errors"""
@@ -33,6 +48,10 @@ class DiscordConnection(BaseConnection):
         super().__init__(config)
         self.base_url = "https://discord.com/api/v10"
         self.bot_username = None
+        # Reuse one keep-alive connection pool for all Discord API calls
+        self._session = requests.Session()
+        # Every call expects JSON back; only the auth header varies per request
+        self._session.headers["Accept"] = "application/json"
 
     @property
     def is_llm_provider(self) -> bool:
@@ -230,22 +249,14 @@ class DiscordConnection(BaseConnection):
             raise ValueError(f"Invalid parameters: {', '.join(errors)}")
 
         # Add config parameters if not provided
-        if action_name == "read-messages":
-            if "count" not in kwargs:
-                kwargs["count"] = self.config["message_read_count"]
-        elif action_name == "read-mentioned-messages":
-            if "count" not in kwargs:
-                kwargs["count"] = self.config["message_read_count"]
-        elif action_name == "react-to-message":
-            if "emoji_name" not in kwargs:
-                kwargs["emoji_name"] = self.config["message_emoji_name"]
-        elif action_name == "list-channels":
-            if "server_id" not in kwargs:
-                kwargs["server_id"] = self.config["server_id"]
+        config_default = ACTION_CONFIG_DEFAULTS.get(action_name)
+        if config_default:
+            param_name, config_key = config_default
+            if param_name not in kwargs:
+                kwargs[param_name] = self.config[config_key]
 
         # Call the appropriate method based on action name
-        method_name = action_name.replace("-", "_")
-        method = getattr(self, method_name)
+        method = self._action_methods[action_name]
         return method(**kwargs)
 
     def list_channels(self, server_id: str, **kwargs) -> dict:
@@ -281,7 +292,7 @@ class DiscordConnection(BaseConnection):
         logger.debug("Sending a new message")
 
         request_path = f"/channels/{channel_id}/messages"
-        payload = json.dumps({"content": f"{message}"})
+        payload = _json_dumps({"content": f"{message}"})
         response = self._post_request(request_path, payload)
         formatted_response = self._format_posted_message(response)
 
@@ -295,7 +306,7 @@ class DiscordConnection(BaseConnection):
         logger.debug("Replying to a message")
 
         request_path = f"/channels/{channel_id}/messages"
-        payload = json.dumps(
+        payload = _json_dumps(
             {
                 "content": f"{message}",
                 "message_reference": {
@@ -386,46 +397,38 @@ class DiscordConnection(BaseConnection):
     def _put_request(self, url_path: str) -> None:
         """Helper method to make PUT request"""
         url = f"{self.base_url}{url_path}"
-        headers = {
-            "Accept": "application/json",
-            "Authorization": self._get_request_auth_token(),
-        }
-        response = requests.request("PUT", url, headers=headers, data={})
+        headers = {"Authorization": self._get_request_auth_token()}
+        response = self._session.request("PUT", url, headers=headers, data={})
         if response.status_code != 204:
             raise DiscordAPIError(
                 f"Failed to called PUT to Discord: {response.status_code} - {response.text}"
             )
         return
 
-    def _post_request(self, url_path: str, payload: str) -> dict:
+    def _post_request(self, url_path: str, payload: Any) -> dict:
         """Helper method to make POST request"""
         url = f"{self.base_url}{url_path}"
         headers = {
             "Content-Type": "application/json",
-            "Accept": "application/json",
             "Authorization": self._get_request_auth_token(),
         }
-        response = requests.request("POST", url, headers=headers, data=payload)
+        response = self._session.request("POST", url, headers=headers, data=payload)
         if response.status_code != 200:
             raise DiscordAPIError(
                 f"Failed to call POST to Discord: {response.status_code} - {response.text}"
             )
-        return json.loads(response.text)
+        return _json_loads(response.content)
 
     def _get_request(self, url_path: str) -> str:
         """Helper method to make GET request"""
         url = f"{self.base_url}{url_path}"
-        headers = {
-            "Accept": "application/json",
-            "Authorization": self._get_request_auth_token(),
-        }
-        print(headers)
-        response = requests.request("GET", url, headers=headers, data={})
+        headers = {"Authorization": self._get_request_auth_token()}
+        response = self._session.request("GET", url, headers=headers, data={})
         if response.status_code != 200:
             raise DiscordAPIError(
                 f"Failed to call GET to Discord: {response.status_code} - {response.text}"
             )
-        return json.loads(response.text)
+        return _json_loads(response.content)
 
     def _get_request_auth_token(self) -> str:
         return f"Bot {os.getenv('DISCORD_TOKEN')}"
@@ -434,14 +437,14 @@ class DiscordConnection(BaseConnection):
         """Helper method to check if Discord is reachable"""
         try:
             url = f"{self.base_url}/users/@me"
-            headers = {"Accept": "application/json", "Authorization": f"Bot {api_key}"}
-            response = requests.request("GET", url, headers=headers, data={})
+            headers = {"Authorization": f"Bot {api_key}"}
+            response = self._session.request("GET", url, headers=headers, data={})
             if response.status_code != 200:
                 raise DiscordAPIError(
                     f"Failed to call GET to Discord: {response.status_code} - {response.text}"
                 )
 
-            self.bot_username = json.loads(response.text)["username"]
+            self.bot_username = _json_loads(response.content)["username"]
 
         except Exception as e:
             raise DiscordConnectionError(f"Connection test failed: {e}")
@@ -1,4 +1,5 @@
 import logging
+import random
 import time
 from typing import Dict, Any, List
 from collections import deque
@@ -40,6 +41,13 @@ class EchochambersConnection(BaseConnection):
                        if not getattr(self, k)]
             raise EchochambersConfigurationError(f"Missing configuration fields: {', '.join(missing)}")
 
+        # Room polls and sends reuse one keep-alive pool; the headers never change
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Content-Type": "application/json",
+            "x-api-key": self.api_key
+        })
+
         logger.info(f"✨ Connected to: {self.api_url}")
         logger.info(f"✨ Entered room: {self.room}")
 
@@ -57,7 +65,7 @@ class EchochambersConnection(BaseConnection):
             'messages_failed': 0,
             'api_latency': [],
             'last_error': None,
-            'last_metrics_log': time.time()
+            'last_metrics_log': time.monotonic()
         }
 
         # Register actions
@@ -203,30 +211,27 @@ class EchochambersConnection(BaseConnection):
 
     def _make_request(self, method: str, url: str, **kwargs) -> Any:
         """Make HTTP request with retries and error handling"""
-        headers = {
-            "Content-Type": "application/json",
-            "x-api-key": self.api_key
-        }
-        kwargs['headers'] = headers
-
         for attempt in range(3):
             try:
-                response = requests.request(method, url, timeout=10, **kwargs)
+                response = self._session.request(method, url, timeout=10, **kwargs)
                 if response.status_code == 429:  # Rate limit
+                    if attempt == 2:
+                        raise EchochambersAPIError("Failed after 3 attempts: rate limited")
                     retry_after = int(response.headers.get('Retry-After', 60))
                     logger.warning(f"Rate limit hit, waiting {retry_after}s")
                     time.sleep(retry_after)
                     continue
                 response.raise_for_status()
                 return response.json()
-            except requests.Timeout:
-                logger.error(f"Timeout on attempt {attempt + 1}")
-                time.sleep(2 ** attempt)  # Exponential backoff
             except requests.RequestException as e:
                 if attempt == 2:
                     raise EchochambersAPIError(f"Failed after 3 attempts: {str(e)}")
-                logger.warning(f"Attempt {attempt + 1} failed: {str(e)}")
-                time.sleep(2 ** attempt)
+                if isinstance(e, requests.Timeout):
+                    logger.error(f"Timeout on attempt {attempt + 1}")
+                else:
+                    logger.warning(f"Attempt {attempt + 1} failed: {str(e)}")
+                # Capped exponential backoff with jitter so agents sharing a room don't retry in lockstep
+                time.sleep(min(30, 2 ** attempt) * (0.5 + random.random()))
 
     def _handle_error(self, message: str, error: Exception) -> None:
         """Handle and log errors"""
@@ -237,7 +242,8 @@ class EchochambersConnection(BaseConnection):
 
     def _log_metrics(self) -> None:
         """Log performance metrics every 5 minutes"""
-        current_time = time.time()
+        # Monotonic so a wall-clock adjustment cannot stall or flood the metrics log
+        current_time = time.monotonic()
         if current_time - self.metrics['last_metrics_log'] >= 300:
             total_attempts = self.metrics['messages_sent'] + self.metrics['messages_failed']
             success_rate = (self.metrics['messages_sent'] / total_attempts * 100) if total_attempts else 0
@@ -294,8 +300,7 @@ class EchochambersConnection(BaseConnection):
         if errors:
             raise ValueError(f"Invalid parameters: {', '.join(errors)}")
 
-        method_name = action_name.replace('-', '_')
-        method = getattr(self, method_name, None)
+        method = self._action_methods.get(action_name)
         if method:
             return method(**kwargs)
         else:
@@ -280,6 +280,5 @@ class EternalAIConnection(BaseConnection):
         if errors:
             raise ValueError(f"Invalid parameters: {', '.join(errors)}")
 
-        method_name = action_name.replace('-', '_')
-        method = getattr(self, method_name)
+        method = self._action_methods[action_name]
         return method(**kwargs)
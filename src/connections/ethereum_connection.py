@@ -9,6 +9,7 @@ from web3.middleware import geth_poa_middleware
 from src.constants.networks import EVM_NETWORKS
 from src.constants.abi import ERC20_ABI
 from src.connections.base_connection import BaseConnection, Action, ActionParameter
+from src.helpers.evm import account_from_key, cached_token_address
 
 logger = logging.getLogger("connections.ethereum_connection")
 
@@ -21,6 +22,7 @@ class EthereumConnection(BaseConnection):
         logger.info("Initializing Ethereum connection...")
         self._web3 = None
         self.NATIVE_TOKEN = "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE"
+        self._token_address_cache = {}
         
         # Get network configuration
         self.network = "ethereum"  # Default to ethereum mainnet
@@ -144,7 +146,7 @@ class EthereumConnection(BaseConnection):
                 raise ValueError("Invalid private key format")
             
             # Test private key by deriving address
-            account = self._web3.eth.account.from_key(private_key)
+            account = account_from_key(private_key)
             logger.info(f"\nDerived address: {account.address}")
             
             # Get optional block explorer API key
@@ -181,7 +183,7 @@ class EthereumConnection(BaseConnection):
                 return False
                 
             # Test account access
-            account = self._web3.eth.account.from_key(private_key)
+            account = account_from_key(private_key)
             balance = self._web3.eth.get_balance(account.address)
                 
             return True
@@ -194,12 +196,16 @@ class EthereumConnection(BaseConnection):
     def get_address(self) -> str:
         try:
             private_key = os.getenv('ETH_PRIVATE_KEY')
-            account = self._web3.eth.account.from_key(private_key)
+            account = account_from_key(private_key)
             return f"Your Ethereum address: {account.address}"
         except Exception as e:
             return f"Failed to get address: {str(e)}"
 
     def _get_token_address(self, ticker: str) -> Optional[str]:
+        """Get token address from DEXScreener, cached for a few minutes per ticker"""
+        return cached_token_address(self._token_address_cache, ticker, self._fetch_token_address)
+
+    def _fetch_token_address(self, ticker: str) -> Optional[str]:
         """Helper function to get token address from DEXScreener"""
         try:
             response = requests.get(
@@ -283,7 +289,7 @@ class EthereumConnection(BaseConnection):
             if not private_key:
                 return "No wallet private key configured in .env"
             
-            account = self._web3.eth.account.from_key(private_key)
+            account = account_from_key(private_key)
             
             # If no token address provided, use native token (ETH)
             if token_address is None:
@@ -337,7 +343,7 @@ class EthereumConnection(BaseConnection):
         """Prepare transfer transaction with proper gas estimation"""
         try:
             private_key = os.getenv('ETH_PRIVATE_KEY')
-            account = self._web3.eth.account.from_key(private_key)
+            account = account_from_key(private_key)
             
             # Get latest nonce and gas price
             nonce = self._web3.eth.get_transaction_count(account.address)
@@ -396,7 +402,7 @@ class EthereumConnection(BaseConnection):
             # Prepare and send transaction
             tx = self._prepare_transfer_tx(to_address, amount, token_address)
             private_key = os.getenv('ETH_PRIVATE_KEY')
-            account = self._web3.eth.account.from_key(private_key)
+            account = account_from_key(private_key)
             
             signed = account.sign_transaction(tx)
             tx_hash = self._web3.eth.send_raw_transaction(signed.rawTransaction)
@@ -465,7 +471,7 @@ class EthereumConnection(BaseConnection):
         """Build swap transaction using route data"""
         try:
             private_key = os.getenv('ETH_PRIVATE_KEY')
-            account = self._web3.eth.account.from_key(private_key)
+            account = account_from_key(private_key)
             
             url = f"{self.aggregator_api}/route/build"
             headers = {"x-client-id": "zerepy"}
@@ -520,7 +526,7 @@ class EthereumConnection(BaseConnection):
             """Handle token approval for spender, returns tx hash if approval needed"""
             try:
                 private_key = os.getenv('ETH_PRIVATE_KEY')
-                account = self._web3.eth.account.from_key(private_key)
+                account = account_from_key(private_key)
                 
                 token_contract = self._web3.eth.contract(
                     address=Web3.to_checksum_address(token_address),
@@ -580,7 +586,7 @@ class EthereumConnection(BaseConnection):
         """Execute token swap using Kyberswap aggregator"""
         try:
             private_key = os.getenv('ETH_PRIVATE_KEY')
-            account = self._web3.eth.account.from_key(private_key)
+            account = account_from_key(private_key)
 
             # Validate balance
             current_balance = self.get_balance(
@@ -633,9 +639,7 @@ class EthereumConnection(BaseConnection):
         if action_name not in self.actions:
             raise KeyError(f"Unknown action: {action_name}")
 
-        load_dotenv()
-        
-        if not self.is_configured(verbose=True):
+        if not self.is_configured_cached(verbose=True):
             raise EthereumConnectionError("Ethereum connection is not properly configured")
 
         action = self.actions[action_name]
@@ -643,6 +647,5 @@ class EthereumConnection(BaseConnection):
         if errors:
             raise ValueError(f"Invalid parameters: {', '.join(errors)}")
 
-        method_name = action_name.replace('-', '_')
-        method = getattr(self, method_name)
+        method = self._action_methods[action_name]
         return method(**kwargs)
\ No newline at end of file
@@ -9,6 +9,7 @@ from web3.middleware import geth_poa_middleware
 from src.constants.networks import EVM_NETWORKS
 from src.constants.abi import ERC20_ABI
 from src.connections.base_connection import BaseConnection, Action, ActionParameter
+from src.helpers.evm import account_from_key, cached_token_address
 
 logger = logging.getLogger("connections.evm_connection")
 
@@ -22,6 +23,7 @@ class EVMConnection(BaseConnection):
     def __init__(self, config: Dict[str, Any]):
         logger.info("Initializing EVM connection...")
         self.NATIVE_TOKEN = "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE"
+        self._token_address_cache = {}
 
             # Determine network from config (defaulting to 'ethereum')
         self._web3 = None
@@ -151,7 +153,7 @@ class EVMConnection(BaseConnection):
                 raise ValueError("Invalid private key format")
             
             # Test private key by deriving address
-            account = self._web3.eth.account.from_key(private_key)
+            account = account_from_key(private_key)
             logger.info(f"\nDerived address: {account.address}")
             
             # Optional block explorer API key input
@@ -185,7 +187,7 @@ class EVMConnection(BaseConnection):
                 return False
                 
             # Test account access
-            account = self._web3.eth.account.from_key(private_key)
+            account = account_from_key(private_key)
             _ = self._web3.eth.get_balance(account.address)
             return True
 
@@ -197,12 +199,16 @@ class EVMConnection(BaseConnection):
     def get_address(self) -> str:
         try:
             private_key = os.getenv('EVM_PRIVATE_KEY') or os.getenv('ETH_PRIVATE_KEY')
-            account = self._web3.eth.account.from_key(private_key)
+            account = account_from_key(private_key)
             return f"Your Ethereum address: {account.address}"
         except Exception as e:
             return f"Failed to get address: {str(e)}"
 
     def _get_token_address(self, ticker: str) -> Optional[str]:
+        """Get token address from DEXScreener, cached for a few minutes per ticker"""
+        return cached_token_address(self._token_address_cache, ticker, self._fetch_token_address)
+
+    def _fetch_token_address(self, ticker: str) -> Optional[str]:
         """Helper function to get token address from DEXScreener"""
         try:
             response = requests.get(f"https://api.dexscreener.com/latest/dex/search?q={ticker}")
@@ -270,7 +276,7 @@ class EVMConnection(BaseConnection):
             if not private_key:
                 return "No wallet private key configured in .env"
             
-            account = self._web3.eth.account.from_key(private_key)
+            account = account_from_key(private_key)
             
             if token_address is None:
                 raw_balance = self._web3.eth.get_balance(account.address)
@@ -292,7 +298,7 @@ class EVMConnection(BaseConnection):
         """Prepare transfer transaction with proper gas estimation"""
         try:
             private_key = os.getenv('EVM_PRIVATE_KEY') or os.getenv('ETH_PRIVATE_KEY')
-            account = self._web3.eth.account.from_key(private_key)
+            account = account_from_key(private_key)
             nonce = self._web3.eth.get_transaction_count(account.address)
             gas_price = self._web3.eth.gas_price
             
@@ -335,7 +341,7 @@ class EVMConnection(BaseConnection):
                 raise ValueError(f"Insufficient balance. Required: {amount}, Available: {current_balance}")
             tx = self._prepare_transfer_tx(to_address, amount, token_address)
             private_key = os.getenv('EVM_PRIVATE_KEY') or os.getenv('ETH_PRIVATE_KEY')
-            account = self._web3.eth.account.from_key(private_key)
+            account = account_from_key(private_key)
             signed = account.sign_transaction(tx)
             tx_hash = self._web3.eth.send_raw_transaction(signed.rawTransaction)
             tx_url = self._get_explorer_link(tx_hash.hex())
@@ -382,7 +388,7 @@ class EVMConnection(BaseConnection):
         """Build swap transaction using route data"""
         try:
             private_key = os.getenv('EVM_PRIVATE_KEY') or os.getenv('ETH_PRIVATE_KEY')
-            account = self._web3.eth.account.from_key(private_key)
+            account = account_from_key(private_key)
             url = f"{self.aggregator_api}/route/build"
             headers = {"x-client-id": "zerepy"}
             payload = {
@@ -423,7 +429,7 @@ class EVMConnection(BaseConnection):
         """Handle token approval for spender"""
         try:
             private_key = os.getenv('EVM_PRIVATE_KEY') or os.getenv('ETH_PRIVATE_KEY')
-            account = self._web3.eth.account.from_key(private_key)
+            account = account_from_key(private_key)
             token_contract = self._web3.eth.contract(
                 address=Web3.to_checksum_address(token_address),
                 abi=ERC20_ABI
@@ -461,7 +467,7 @@ class EVMConnection(BaseConnection):
         """Execute token swap using Kyberswap aggregator"""
         try:
             private_key = os.getenv("EVM_PRIVATE_KEY") or os.getenv("ETH_PRIVATE_KEY")
-            account = self._web3.eth.account.from_key(private_key)
+            account = account_from_key(private_key)
             current_balance = self.get_balance(
                 token_address=None if token_in.lower() == self.NATIVE_TOKEN.lower() else token_in
             )
@@ -495,13 +501,11 @@ class EVMConnection(BaseConnection):
         """Execute an Ethereum action with validation"""
         if action_name not in self.actions:
             raise KeyError(f"Unknown action: {action_name}")
-        load_dotenv()
-        if not self.is_configured(verbose=True):
+        if not self.is_configured_cached(verbose=True):
             raise EthereumConnectionError("Ethereum connection is not properly configured")
         action = self.actions[action_name]
         errors = action.validate_params(kwargs)
         if errors:
             raise ValueError(f"Invalid parameters: {', '.join(errors)}")
-        method_name = action_name.replace('-', '_')
-        method = getattr(self, method_name)
+        method = self._action_methods[action_name]
         return method(**kwargs)
@@ -251,7 +251,8 @@ class GoatConnection(BaseConnection):
             )
             self._action_registry[tool.name] = tool
 
-            register_action(tool.name)(
+            # Runs again on reconfigure or a reloaded agent; the newest instance's handler wins
+            register_action(tool.name, replace=True)(
                 lambda agent, tool_name=tool.name, **kwargs: self.perform_action(
                     tool_name, kwargs
                 )
@@ -199,10 +199,7 @@ class HyperbolicConnection(BaseConnection):
         if action_name not in self.actions:
             raise KeyError(f"Unknown action: {action_name}")
 
-        # Explicitly reload environment variables
-        load_dotenv()
-        
-        if not self.is_configured(verbose=True):
+        if not self.is_configured_cached(verbose=True):
             raise HyperbolicConfigurationError("Hyperbolic is not properly configured")
 
         action = self.actions[action_name]
@@ -211,6 +208,5 @@ class HyperbolicConnection(BaseConnection):
             raise ValueError(f"Invalid parameters: {', '.join(errors)}")
 
         # Call the appropriate method based on action name
-        method_name = action_name.replace('-', '_')
-        method = getattr(self, method_name)
+        method = self._action_methods[action_name]
         return method(**kwargs)
\ No newline at end of file
@@ -9,6 +9,7 @@ from web3.middleware import geth_poa_middleware
 from src.constants.networks import EVM_NETWORKS
 from src.constants.abi import ERC20_ABI
 from src.connections.base_connection import BaseConnection, Action, ActionParameter
+from src.helpers.evm import account_from_key
 
 logger = logging.getLogger("connections.monad_connection")
 
@@ -118,7 +119,7 @@ class MonadConnection(BaseConnection):
         private_key = os.getenv('MONAD_PRIVATE_KEY')
         if not private_key:
             raise MonadConnectionError("No wallet private key configured")
-        return self._web3.eth.account.from_key(private_key)
+        return account_from_key(private_key)
 
     def configure(self) -> bool:
         """Sets up Monad wallet"""
@@ -145,7 +146,7 @@ class MonadConnection(BaseConnection):
                 raise ValueError("Invalid private key format")
             
             # Test private key by deriving address
-            account = self._web3.eth.account.from_key(private_key)
+            account = account_from_key(private_key)
             logger.info(f"\nDerived address: {account.address}")
 
             # Test connection
@@ -340,29 +341,17 @@ class MonadConnection(BaseConnection):
             }
 
             url = f"{ZERO_EX_API_URL}/permit2/quote"
-            logger.debug("\nHEADERS ")
-            logger.debug(headers)
-            logger.debug("\nPARAMS ")
-            logger.debug(params)
-            logger.debug("\nURL ")
-            logger.debug(url)
+            # Headers carry the 0x API key, so only the URL and params are logged
+            logger.debug("Requesting 0x quote from %s with params %s", url, params)
             response = requests.get(
                 url,
                 headers=headers,
                 params=params
             )
-            logger.debug(f"\nHEADER FROM OBJECT : {response.request.headers}")
             response.raise_for_status()
 
-                # Log full response details
-            logger.info("\n=== 0x API Response ===")
-            logger.info(f"Status Code: {response.status_code}")
-            logger.info("Headers:")
-            for key, value in response.headers.items():
-                logger.info(f"{key}: {value}")
-            logger.info("\nResponse Body:")
-            logger.info(response.text)
-            logger.info("=== End Response ===\n")
+            # Log the size rather than the body; formatting is deferred until DEBUG is on
+            logger.debug("0x quote response: %s, %d bytes", response.status_code, len(response.content))
             
             data = response.json()
             return data
@@ -400,7 +389,7 @@ class MonadConnection(BaseConnection):
                 account.address
             )
             
-            logger.debug(f"Quote data received: {quote_data}")
+            logger.debug("Quote data received: %s", quote_data)
 
             # Extract transaction data from quote
             transaction = quote_data.get("transaction")
@@ -506,9 +495,7 @@ class MonadConnection(BaseConnection):
         if action_name not in self.actions:
             raise KeyError(f"Unknown action: {action_name}")
 
-        load_dotenv()
-        
-        if not self.is_configured(verbose=True):
+        if not self.is_configured_cached(verbose=True):
             raise MonadConnectionError("Monad connection is not properly configured")
 
         action = self.actions[action_name]
@@ -516,8 +503,7 @@ class MonadConnection(BaseConnection):
         if errors:
             raise ValueError(f"Invalid parameters: {', '.join(errors)}")
 
-        method_name = action_name.replace('-', '_')
-        method = getattr(self, method_name)
+        method = self._action_methods[action_name]
         
         try:
             return method(**kwargs)
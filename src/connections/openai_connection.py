@@ -7,6 +7,16 @@ from src.connections.base_connection import BaseConnection, Action, ActionParame
 
 logger = logging.getLogger("connections.openai_connection")
 
+# One client per API key, shared by every agent so they reuse a single connection pool
+_CLIENTS: Dict[str, OpenAI] = {}
+
+def _get_shared_client(api_key: str) -> OpenAI:
+    """Get or create the process-wide OpenAI client for an API key"""
+    client = _CLIENTS.get(api_key)
+    if client is None:
+        client = _CLIENTS.setdefault(api_key, OpenAI(api_key=api_key))
+    return client
+
 class OpenAIConnectionError(Exception):
     """Base exception for OpenAI connection errors"""
     pass
@@ -74,7 +84,7 @@ class OpenAIConnection(BaseConnection):
             api_key = os.getenv("OPENAI_API_KEY")
             if not api_key:
                 raise OpenAIConfigurationError("OpenAI API key not found in environment")
-            self._client = OpenAI(api_key=api_key)
+            self._client = _get_shared_client(api_key)
         return self._client
 
     def configure(self) -> bool:
@@ -121,7 +131,7 @@ class OpenAIConnection(BaseConnection):
             if not api_key:
                 return False
 
-            client = OpenAI(api_key=api_key)
+            client = _get_shared_client(api_key)
             client.models.list()
             return True
             
@@ -201,6 +211,5 @@ class OpenAIConnection(BaseConnection):
             raise ValueError(f"Invalid parameters: {', '.join(errors)}")
 
         # Call the appropriate method based on action name
-        method_name = action_name.replace('-', '_')
-        method = getattr(self, method_name)
+        method = self._action_methods[action_name]
         return method(**kwargs)
@@ -1,7 +1,6 @@
 import logging
 import os
 import requests
-import asyncio
 from typing import Dict, Any, Optional
 
 from src.connections.base_connection import BaseConnection, Action, ActionParameter
@@ -16,6 +15,7 @@ from src.helpers.solana.token_deploy import TokenDeploymentManager
 from src.helpers.solana.performance import SolanaPerformanceTracker
 from src.helpers.solana.transfer import SolanaTransferHelper
 from src.helpers.solana.read import SolanaReadHelper
+from src.helpers.event_loop import BackgroundEventLoop
 
 
 from dotenv import load_dotenv, set_key
@@ -47,14 +47,18 @@ class SolanaConnection(BaseConnection):
     def __init__(self, config: Dict[str, Any]):
         logger.info("Initializing Solana connection...")
         super().__init__(config)
+        self._async_client = None
+        self._loop = BackgroundEventLoop("solana-loop")
 
     @property
     def is_llm_provider(self) -> bool:
         return False
 
     def _get_connection_async(self) -> AsyncClient:
-        conn = AsyncClient(self.config["rpc"])
-        return conn
+        # Safe to share: every coroutine runs on the same loop, so the RPC pool stays warm
+        if self._async_client is None:
+            self._async_client = AsyncClient(self.config["rpc"])
+        return self._async_client
 
     def _get_wallet(self):
         creds = self._get_credentials()
@@ -63,7 +67,9 @@ class SolanaConnection(BaseConnection):
     def _get_credentials(self) -> Dict[str, str]:
         """Get Solana credentials from environment with validation"""
         logger.debug("Retrieving Solana Credentials")
-        load_dotenv()
+        # Every action fetches the wallet, so only read .env while the key is still missing
+        if not os.getenv("SOLANA_PRIVATE_KEY"):
+            load_dotenv()
         required_vars = {"SOLANA_PRIVATE_KEY": "solana wallet private key"}
         credentials = {}
         missing = []
@@ -293,7 +299,7 @@ class SolanaConnection(BaseConnection):
             amount,
             token_mint,
         )
-        res = asyncio.run(res)
+        res = self._loop.run(res)
         logger.debug(f"Transferred {amount} to {to_address}\nTransaction ID: {res}")
         return res
 
@@ -318,7 +324,7 @@ class SolanaConnection(BaseConnection):
             input_mint,
             slippage_bps,
         )
-        res = asyncio.run(res)
+        res = self._loop.run(res)
         return res
 
     def get_balance(self, token_address: str = None) -> float:
@@ -329,7 +335,7 @@ class SolanaConnection(BaseConnection):
         res = SolanaReadHelper.get_balance(
             self._get_connection_async(), self._get_wallet(), token_address
         )
-        res = asyncio.run(res)
+        res = self._loop.run(res)
         return res
 
     def stake(self, amount: float) -> str:
@@ -337,7 +343,7 @@ class SolanaConnection(BaseConnection):
         res = StakeManager.stake_with_jup(
             self._get_connection_async(), self._get_wallet(), amount
         )
-        res = asyncio.run(res)
+        res = self._loop.run(res)
         logger.debug(f"Staked {amount} SOL\nTransaction ID: {res}")
         return res
 
@@ -348,14 +354,14 @@ class SolanaConnection(BaseConnection):
         # res = AssetLender.lend_asset(
         #     self._get_connection_async(), self._get_wallet(), amount
         # )
-        # res = asyncio.run(res)
+        # res = self._loop.run(res)
         # logger.debug(f"Lent {amount} USDC\nTransaction ID: {res}")
         # return res
 
     def request_faucet(self) -> str:
         logger.info("Requesting faucet funds")
         res = FaucetManager.request_faucet_funds(self)
-        res = asyncio.run(res)
+        res = self._loop.run(res)
         logger.debug(f"Requested faucet funds\nTransaction ID: {res}")
         return res
 
@@ -365,7 +371,7 @@ class SolanaConnection(BaseConnection):
         # res = TokenDeploymentManager.deploy_token(
         #     self._get_connection_async(), self._get_wallet(), decimals
         # )
-        # res = asyncio.run(res)
+        # res = self._loop.run(res)
         # logger.debug(
         #     f"Deployed token with {decimals} decimals\nToken Mint: {res['mint']}"
         # )
@@ -377,7 +383,7 @@ class SolanaConnection(BaseConnection):
     # todo: test on mainnet
     def get_tps(self) -> int:
         res = SolanaPerformanceTracker.fetch_current_tps(self._get_connection_async())
-        res = asyncio.run(res)
+        res = self._loop.run(res)
         return res
 
     def get_token_by_ticker(self, ticker: str) -> str:
@@ -409,7 +415,7 @@ class SolanaConnection(BaseConnection):
         #    image_url,
         #    options,
         # )
-        # res = asyncio.run(res)
+        # res = self._loop.run(res)
         # logger.debug(
         #    f"Launched Pump & Fun token {token_ticker}\nToken Mint: {res['mint']}"
         # )
@@ -425,6 +431,5 @@ class SolanaConnection(BaseConnection):
         if errors:
             raise ValueError(f"Invalid parameters: {', '.join(errors)}")
 
-        method_name = action_name.replace("-", "_")
-        method = getattr(self, method_name)
+        method = self._action_methods[action_name]
         return method(**kwargs)
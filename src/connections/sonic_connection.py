@@ -9,6 +9,7 @@ from web3.middleware import geth_poa_middleware
 from src.constants.abi import ERC20_ABI
 from src.connections.base_connection import BaseConnection, Action, ActionParameter
 from src.constants.networks import SONIC_NETWORKS
+from src.helpers.evm import account_from_key, cached_token_address
 
 logger = logging.getLogger("connections.sonic_connection")
 
@@ -22,6 +23,7 @@ class SonicConnection(BaseConnection):
     def __init__(self, config: Dict[str, Any]):
         logger.info("Initializing Sonic connection...")
         self._web3 = None
+        self._token_address_cache = {}
         
         # Get network configuration
         network = config.get("network", "mainnet")
@@ -73,11 +75,15 @@ class SonicConnection(BaseConnection):
         return config
 
     def get_token_by_ticker(self, ticker: str) -> Optional[str]:
-        """Get token address by ticker symbol"""
+        """Get token address by ticker symbol, cached for a few minutes per ticker"""
+        if ticker.lower() in ["s", "S"]:
+            return "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE"
+
+        return cached_token_address(self._token_address_cache, ticker, self._fetch_token_address)
+
+    def _fetch_token_address(self, ticker: str) -> Optional[str]:
+        """Look up a token address on DEXScreener"""
         try:
-            if ticker.lower() in ["s", "S"]:
-                return "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE"
-                
             response = requests.get(
                 f"https://api.dexscreener.com/latest/dex/search?q={ticker}"
             )
@@ -165,7 +171,7 @@ class SonicConnection(BaseConnection):
             if not self._web3.is_connected():
                 raise SonicConnectionError("Failed to connect to Sonic network")
 
-            account = self._web3.eth.account.from_key(private_key)
+            account = account_from_key(private_key)
             logger.info(f"\n✅ Successfully connected with address: {account.address}")
             return True
 
@@ -199,7 +205,7 @@ class SonicConnection(BaseConnection):
                 private_key = os.getenv('SONIC_PRIVATE_KEY')
                 if not private_key:
                     raise SonicConnectionError("No wallet configured")
-                account = self._web3.eth.account.from_key(private_key)
+                account = account_from_key(private_key)
                 address = account.address
 
             if token_address:
@@ -222,7 +228,7 @@ class SonicConnection(BaseConnection):
         """Transfer $S or tokens to an address"""
         try:
             private_key = os.getenv('SONIC_PRIVATE_KEY')
-            account = self._web3.eth.account.from_key(private_key)
+            account = account_from_key(private_key)
             chain_id = self._web3.eth.chain_id
             
             if token_address:
@@ -306,7 +312,7 @@ class SonicConnection(BaseConnection):
         """Get encoded swap data from Kyberswap API"""
         try:
             private_key = os.getenv('SONIC_PRIVATE_KEY')
-            account = self._web3.eth.account.from_key(private_key)
+            account = account_from_key(private_key)
             
             url = f"{self.aggregator_api}/route/build"
             headers = {"x-client-id": "zerepy"}
@@ -337,7 +343,7 @@ class SonicConnection(BaseConnection):
         """Handle token approval for spender"""
         try:
             private_key = os.getenv('SONIC_PRIVATE_KEY')
-            account = self._web3.eth.account.from_key(private_key)
+            account = account_from_key(private_key)
             
             token_contract = self._web3.eth.contract(
                 address=Web3.to_checksum_address(token_address),
@@ -376,7 +382,7 @@ class SonicConnection(BaseConnection):
         """Execute a token swap using the KyberSwap router"""
         try:
             private_key = os.getenv('SONIC_PRIVATE_KEY')
-            account = self._web3.eth.account.from_key(private_key)
+            account = account_from_key(private_key)
 
             # Check token balance before proceeding
             current_balance = self.get_balance(
@@ -443,9 +449,7 @@ class SonicConnection(BaseConnection):
         if action_name not in self.actions:
             raise KeyError(f"Unknown action: {action_name}")
 
-        load_dotenv()
-        
-        if not self.is_configured(verbose=True):
+        if not self.is_configured_cached(verbose=True):
             raise SonicConnectionError("Sonic is not properly configured")
 
         action = self.actions[action_name]
@@ -453,6 +457,5 @@ class SonicConnection(BaseConnection):
         if errors:
             raise ValueError(f"Invalid parameters: {', '.join(errors)}")
 
-        method_name = action_name.replace('-', '_')
-        method = getattr(self, method_name)
+        method = self._action_methods[action_name]
         return method(**kwargs)
\ No newline at end of file
@@ -7,6 +7,12 @@ from src.connections.base_connection import BaseConnection, Action, ActionParame
 from src.helpers import print_h_bar
 import json,requests
 
+try:
+    # orjson decodes stream lines straight from bytes when it is installed
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger("connections.twitter_connection")
 
 class TwitterConnectionError(Exception):
@@ -148,7 +154,7 @@ class TwitterConnection(BaseConnection):
         Returns:
             Dict containing the API response (or raw response if stream=True)
         """
-        logger.debug(f"Making {method.upper()} request to {endpoint}")
+        logger.debug("Making %s request to %s", method.upper(), endpoint)
         try:
             full_url = f"https://api.twitter.com/2/{endpoint.lstrip('/')}"
 
@@ -172,7 +178,7 @@ class TwitterConnection(BaseConnection):
                     f"Request failed with status {response.status_code}: {response.text}"
                 )
 
-            logger.debug(f"Request successful: {response.status_code}")
+            logger.debug("Request successful: %s", response.status_code)
 
             if stream:
                 return response
@@ -389,8 +395,7 @@ class TwitterConnection(BaseConnection):
             kwargs["count"] = self.config["timeline_read_count"]
 
         # Call the appropriate method based on action name
-        method_name = action_name.replace('-', '_')
-        method = getattr(self, method_name)
+        method = self._action_methods[action_name]
         return method(**kwargs)
 
     def read_timeline(self, count: int = None, **kwargs) -> list:
@@ -563,7 +568,7 @@ class TwitterConnection(BaseConnection):
                 
             for line in response.iter_lines():
                 if line:
-                    tweet_data = json.loads(line)['data']
+                    tweet_data = _json_loads(line)['data']
                     yield tweet_data
                 
         except Exception as e:
@@ -0,0 +1,19 @@
+import asyncio
+import threading
+
+
+class BackgroundEventLoop:
+    """An event loop on a daemon thread, started on first use, for running async SDK calls from sync code"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._loop = None
+        self._lock = threading.Lock()
+
+    def run(self, coro):
+        """Run a coroutine on the background loop and wait for its result"""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name=self.name, daemon=True).start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
@@ -0,0 +1,30 @@
+import time
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
+from eth_account import Account
+from eth_account.signers.local import LocalAccount
+
+# DEXScreener ticker lookups are reference data; reuse them for a few minutes
+TOKEN_ADDRESS_CACHE_TTL = 300
+
+
+@lru_cache(maxsize=8)
+def account_from_key(private_key: str) -> LocalAccount:
+    """Derive the account for a private key, memoized since the key derivation is slow"""
+    return Account.from_key(private_key)
+
+
+def cached_token_address(
+    cache: Dict[str, Tuple[float, str]], ticker: str, fetch: Callable[[str], Optional[str]]
+) -> Optional[str]:
+    """Resolve a ticker through a per-connection cache, fetching only when the entry is missing or stale"""
+    key = ticker.lower()
+    cached = cache.get(key)
+    if cached and time.monotonic() - cached[0] < TOKEN_ADDRESS_CACHE_TTL:
+        return cached[1]
+
+    address = fetch(ticker)
+    # Only successful lookups are cached so a transient failure is retried
+    if address:
+        cache[key] = (time.monotonic(), address)
+    return address
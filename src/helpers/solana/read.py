@@ -10,11 +10,17 @@ from src.types import JupiterTokenData
 from solders.keypair import Keypair  # type: ignore
 from solders.pubkey import Pubkey  # type: ignore
 import requests
+import time
 
 from spl.token.async_client import AsyncToken
 from spl.token.instructions import get_associated_token_address
 from spl.token.constants import TOKEN_PROGRAM_ID
 
+# The verified token list is large and changes slowly, so it is parsed once
+# per TTL and indexed by mint address
+VERIFIED_TOKENS_TTL = 600
+_verified_tokens = None
+
 
 class SolanaReadHelper:
     @staticmethod
@@ -109,21 +115,25 @@ class SolanaReadHelper:
     def get_token_by_address(
         address: str,
     ) -> str:
+        global _verified_tokens
         try:
-            response = requests.get(
-                "https://tokens.jup.ag/tokens?tags=verified",
-                headers={"Content-Type": "application/json"},
-            )
-            response.raise_for_status()
+            if _verified_tokens is None or time.monotonic() - _verified_tokens[0] >= VERIFIED_TOKENS_TTL:
+                response = requests.get(
+                    "https://tokens.jup.ag/tokens?tags=verified",
+                    headers={"Content-Type": "application/json"},
+                )
+                response.raise_for_status()
 
-            data = response.json()
-            for token in data:
-                if token.get("address") == str(address):
-                    return JupiterTokenData(
-                        address=token.get("address"),
-                        symbol=token.get("symbol"),
-                        name=token.get("name"),
-                    )
-            return None
+                tokens_by_address = {token.get("address"): token for token in response.json()}
+                _verified_tokens = (time.monotonic(), tokens_by_address)
+
+            token = _verified_tokens[1].get(str(address))
+            if token is None:
+                return None
+            return JupiterTokenData(
+                address=token.get("address"),
+                symbol=token.get("symbol"),
+                name=token.get("name"),
+            )
         except Exception as error:
             raise Exception(f"Error fetching token data: {str(error)}")
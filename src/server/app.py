@@ -77,8 +77,27 @@ class ZerePyServer:
     def __init__(self):
         self.app = FastAPI(title="ZerePy Server")
         self.state = ServerState()
+        self._agents_cache = None
         self.setup_routes()
 
+    def _list_agent_names(self) -> List[str]:
+        """List agent names, rescanning only when the agents directory changes"""
+        agents_dir = Path("agents")
+        try:
+            mtime_ns = agents_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+
+        # Adding, removing or renaming a file bumps the directory mtime
+        if self._agents_cache is None or self._agents_cache[0] != mtime_ns:
+            agents = [
+                agent_file.stem
+                for agent_file in agents_dir.glob("*.json")
+                if agent_file.stem != "general"
+            ]
+            self._agents_cache = (mtime_ns, agents)
+        return list(self._agents_cache[1])
+
     def setup_routes(self):
         @self.app.get("/")
         async def root():
@@ -93,13 +112,7 @@ class ZerePyServer:
         async def list_agents():
             """List available agents"""
             try:
-                agents = []
-                agents_dir = Path("agents")
-                if agents_dir.exists():
-                    for agent_file in agents_dir.glob("*.json"):
-                        if agent_file.stem != "general":
-                            agents.append(agent_file.stem)
-                return {"agents": agents}
+                return {"agents": self._list_agent_names()}
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
 
@@ -107,7 +120,7 @@ class ZerePyServer:
         async def load_agent(name: str):
             """Load a specific agent"""
             try:
-                self.state.cli._load_agent_from_file(name)
+                await asyncio.to_thread(self.state.cli._load_agent_from_file, name)
                 return {
                     "status": "success",
                     "agent": name
@@ -121,13 +134,18 @@ class ZerePyServer:
             if not self.state.cli.agent:
                 raise HTTPException(status_code=400, detail="No agent loaded")
             
-            try:
+            def get_connections():
                 connections = {}
                 for name, conn in self.state.cli.agent.connection_manager.connections.items():
                     connections[name] = {
                         "configured": conn.is_configured(),
                         "is_llm_provider": conn.is_llm_provider
                     }
+                return connections
+
+            try:
+                # is_configured may call out to the provider, so keep it off the event loop
+                connections = await asyncio.to_thread(get_connections)
                 return {"connections": connections}
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
@@ -177,11 +195,12 @@ class ZerePyServer:
                 raise HTTPException(status_code=400, detail="No agent loaded")
             
             try:
-                connection = self.state.cli.agent.connection_manager.connections.get(name)
-                if not connection:
+                connection_manager = self.state.cli.agent.connection_manager
+                if name not in connection_manager.connections:
                     raise HTTPException(status_code=404, detail=f"Connection {name} not found")
                 
-                success = connection.configure(**config.params)
+                # Go through the manager so the cached is_configured result is dropped
+                success = await asyncio.to_thread(connection_manager.configure_connection, name, **config.params)
                 if success:
                     return {"status": "success", "message": f"Connection {name} configured successfully"}
                 else:
@@ -201,9 +220,10 @@ class ZerePyServer:
                 if not connection:
                     raise HTTPException(status_code=404, detail=f"Connection {name} not found")
                     
+                configured = await asyncio.to_thread(connection.is_configured, verbose=True)
                 return {
                     "name": name,
-                    "configured": connection.is_configured(verbose=True),
+                    "configured": configured,
                     "is_llm_provider": connection.is_llm_provider
                 }
                 